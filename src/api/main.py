@@ -1,7 +1,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI(title="Data Processing Workflow API")
+app = FastAPI(
+    title="Data Processing Workflow API",
+    default_response_class=ORJSONResponse
+)
 
 # Configure CORS
 app.add_middleware(
@@ -2,19 +2,36 @@ from typing import Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 import asyncio
 import json
+import os
+import time
 
-from fastapi import FastAPI, WebSocket, HTTPException, BackgroundTasks
+from fastapi import FastAPI, WebSocket, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import orjson
 import structlog
-from pydantic import BaseModel
-import aiohttp
+from pydantic import BaseModel, ConfigDict
 
+from .config import configure_logging, load_config
+from .http_session import HTTPSession
 from .queue import QueueManager
 
 logger = structlog.get_logger()
 
+# Pre-encoded acknowledgement returned for every ingested message
+_ENQUEUED_BODY = orjson.dumps({
+    "status": "success",
+    "message": "Data enqueued successfully"
+})
+_WS_ACK = _ENQUEUED_BODY.decode()
+
+# Shared HTTP session for outbound requests, created on first use
+_http = HTTPSession()
+
 class WebhookPayload(BaseModel):
     """Model for webhook payload validation."""
+    model_config = ConfigDict(extra="ignore")
+
     workflow_name: str
     data: Dict[str, Any]
 
@@ -26,12 +43,19 @@ class APIServer:
         queue_manager: QueueManager,
         scheduled_tasks: Optional[Dict[str, Callable[[], Awaitable[None]]]] = None
     ):
-        self.app = FastAPI(title="Data VM Processing API")
+        self.app = FastAPI(
+            title="Data VM Processing API",
+            default_response_class=ORJSONResponse
+        )
         self.queue_manager = queue_manager
         self.scheduled_tasks = scheduled_tasks or {}
         self._logger = logger.bind(component="api_server")
+        self._health_second = 0
+        self._health_body: Dict[str, str] = {}
         self._setup_middleware()
         self._setup_routes()
+        self.app.add_event_handler("startup", self._on_startup)
+        self.app.add_event_handler("shutdown", close_http_session)
 
     def _setup_middleware(self) -> None:
         """Setup middleware for the FastAPI application."""
@@ -49,16 +73,11 @@ class APIServer:
         @self.app.post("/webhook/{workflow_name}")
         async def webhook_endpoint(
             workflow_name: str,
-            payload: WebhookPayload,
-            background_tasks: BackgroundTasks
+            payload: WebhookPayload
         ):
             """Webhook endpoint for workflow ingestion."""
-            background_tasks.add_task(
-                self.queue_manager.enqueue,
-                workflow_name,
-                payload.data
-            )
-            return {"status": "success", "message": "Data enqueued successfully"}
+            await self.queue_manager.enqueue(workflow_name, payload.data)
+            return Response(content=_ENQUEUED_BODY, media_type="application/json")
 
         @self.app.websocket("/ws/{workflow_name}")
         async def websocket_endpoint(websocket: WebSocket, workflow_name: str):
@@ -68,12 +87,9 @@ class APIServer:
 
             try:
                 while True:
-                    data = await websocket.receive_json()
+                    data = orjson.loads(await websocket.receive_text())
                     await self.queue_manager.enqueue(workflow_name, data)
-                    await websocket.send_json({
-                        "status": "success",
-                        "message": "Data enqueued successfully"
-                    })
+                    await websocket.send_text(_WS_ACK)
 
             except Exception as e:
                 self._logger.error("websocket_error", error=str(e))
@@ -82,10 +98,15 @@ class APIServer:
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint."""
-            return {
-                "status": "healthy",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            # Rebuild the body at most once per second
+            now = int(time.time())
+            if now != self._health_second:
+                self._health_second = now
+                self._health_body = {
+                    "status": "healthy",
+                    "timestamp": datetime.utcfromtimestamp(now).isoformat()
+                }
+            return self._health_body
 
     async def start_scheduled_tasks(self) -> None:
         """Start all scheduled tasks."""
@@ -109,23 +130,61 @@ class APIServer:
                 )
             await asyncio.sleep(60)  # Run every minute
 
-    async def start(self, host: str = "0.0.0.0", port: int = 8000) -> None:
-        """Start the API server."""
-        import uvicorn
-        
-        # Start scheduled tasks
+    async def _on_startup(self) -> None:
+        """Connect to Redis and start scheduled tasks before accepting traffic."""
+        await self.queue_manager.ensure_connected()
         await self.start_scheduled_tasks()
-        
-        # Start API server
-        config = uvicorn.Config(
+
+    def _uvicorn_config(self, host: str, port: int):
+        """Build the uvicorn config (uvloop + httptools from uvicorn[standard])."""
+        import uvicorn
+
+        return uvicorn.Config(
             self.app,
             host=host,
             port=port,
+            loop="uvloop",
+            http="httptools",
+            ws="websockets",
             log_level="info"
         )
-        server = uvicorn.Server(config)
+
+    def run(self, host: str = "0.0.0.0", port: int = 8000) -> None:
+        """Run the API server on a new uvloop event loop, blocking until it exits."""
+        import uvicorn
+
+        # Server.run() installs the configured loop before starting it
+        uvicorn.Server(self._uvicorn_config(host, port)).run()
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8000) -> None:
+        """Start the API server on the already-running event loop.
+
+        The loop is the caller's, so uvicorn's loop setting has no effect here;
+        use run() to get uvloop.
+        """
+        import uvicorn
+
+        server = uvicorn.Server(self._uvicorn_config(host, port))
         await server.serve()
 
+def create_api_server(
+    redis_configs: Dict[str, str],
+    scheduled_tasks: Optional[Dict[str, Callable[[], Awaitable[None]]]] = None
+) -> APIServer:
+    """Build an APIServer and its QueueManager for deployment.
+
+    Logging is configured before the QueueManager is created, since its
+    loggers are bound in __init__ and only pick up the level filter if it is
+    installed first. Otherwise per-item DEBUG events on the ingestion path are
+    still rendered.
+    """
+    configure_logging()
+    return APIServer(QueueManager(redis_configs), scheduled_tasks)
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session."""
+    await _http.close()
+
 async def fetch_external_api(
     url: str,
     method: str = "GET",
@@ -133,11 +192,17 @@ async def fetch_external_api(
     data: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Helper function to make HTTP requests to external APIs."""
-    async with aiohttp.ClientSession() as session:
-        async with session.request(
-            method,
-            url,
-            headers=headers,
-            json=data
-        ) as response:
-            return await response.json() 
\ No newline at end of file
+    session = await _http.get()
+    async with session.request(
+        method,
+        url,
+        headers=headers,
+        json=data
+    ) as response:
+        return await response.json(loads=orjson.loads)
+
+if __name__ == "__main__":
+    api_config = load_config().api
+    create_api_server({
+        "default": os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    }).run(api_config.host, api_config.port)
@@ -1,7 +1,15 @@
 from typing import Dict, Any, Optional
+import asyncio
+import functools
+import logging
 import os
-import json
+import re
+import orjson
 from pydantic import BaseModel, Field
+import structlog
+
+# Matches a whole-string "${ENV_VAR}" placeholder
+_ENV_VAR_RE = re.compile(r"\$\{(.*)\}", re.DOTALL)
 
 class WorkflowConfig(BaseModel):
     enabled: bool
@@ -48,27 +56,49 @@ class Config(BaseModel):
     deployment: DeploymentConfig
 
 def load_config(config_path: str = "config.json") -> Config:
-    """Load configuration from JSON file."""
-    if not os.path.exists(config_path):
+    """Load configuration from JSON file.
+
+    The parsed configuration is cached per path and modification time, so
+    repeated calls only cost a stat until the file changes. Call
+    reload_config() to force a re-read regardless.
+    """
+    # One cache entry per file, however the path is spelled
+    config_path = os.path.abspath(config_path)
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(config_path, 'r') as f:
-        config_data = json.load(f)
-    
-    # Replace environment variables
-    def replace_env_vars(data: Any) -> Any:
-        if isinstance(data, str) and data.startswith("${") and data.endswith("}"):
-            env_var = data[2:-1]
-            return os.getenv(env_var)
-        elif isinstance(data, dict):
-            return {k: replace_env_vars(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [replace_env_vars(item) for item in data]
-        return data
-    
-    config_data = replace_env_vars(config_data)
-    
-    return Config(**config_data)
+
+    return _load_config_cached(config_path, mtime_ns)
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Config:
+    """Read and parse the configuration file (cached by load_config)."""
+    with open(config_path, 'rb') as f:
+        config_data = orjson.loads(f.read())
+
+    _replace_env_vars(config_data)
+
+    return Config.model_validate(config_data)
+
+def reload_config() -> None:
+    """Discard cached configuration so the next load re-reads the file."""
+    _load_config_cached.cache_clear()
+
+def _replace_env_vars(data: Any) -> Any:
+    """Replace "${ENV_VAR}" string values with environment variables, in place."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                match = _ENV_VAR_RE.fullmatch(value)
+                if match:
+                    node[key] = os.getenv(match.group(1))
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return data
 
 def get_workflow_config(workflow_name: str) -> Optional[WorkflowConfig]:
     """Get configuration for a specific workflow."""
@@ -83,4 +113,37 @@ def is_redis_enabled() -> bool:
 def get_redis_config() -> Optional[RedisConfig]:
     """Get Redis configuration if enabled."""
     config = load_config()
-    return config.redis if config.redis.enabled else None 
\ No newline at end of file
+    return config.redis if config.redis.enabled else None
+
+def configure_logging(level: Optional[str] = None) -> None:
+    """Configure structlog to drop records below the configured log level.
+
+    Call this before creating loggers with bind(), since bound loggers keep
+    the configuration that was active when they were bound. Falls back to
+    INFO if config.json is missing or unreadable, or the level is unknown.
+    """
+    problem = None
+    if level is None:
+        try:
+            level = load_config().logging.level
+        except (FileNotFoundError, ValueError) as e:
+            level, problem = "info", str(e)
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        numeric_level, problem = logging.INFO, f"Unknown log level: {level}"
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level)
+    )
+    if problem:
+        structlog.get_logger().warning("log_level_defaulted", level="info", reason=problem)
+
+def install_uvloop() -> None:
+    """Make uvloop the event loop policy for asyncio.run(), if it is installed.
+
+    uvloop is unavailable on Windows, where the default event loop is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
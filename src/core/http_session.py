@@ -0,0 +1,39 @@
+from typing import Optional
+
+import aiohttp
+
+class HTTPSession:
+    """Lazily created aiohttp session that may instead be borrowed from a caller."""
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize the session holder.
+
+        Args:
+            session: Optional shared HTTP session; it is used as-is and left
+                for the caller to close. When omitted, a session is created
+                on first use and closed by close()
+        """
+        self._session = session
+        self._owns_session = session is None
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._owns_session = True
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=30, connect=10)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session if it was created here."""
+        if self._session and self._owns_session:
+            await self._session.close()
+        self._session = None
@@ -1,40 +1,77 @@
 import asyncio
 import importlib
+import inspect
 import os
-from typing import Dict, Type
+import sys
+import typing
+from typing import Any, Dict, Optional, Set, Type
 
 import structlog
 from prometheus_client import Counter, Gauge
 
-from .workflow import BaseWorkflow, WorkflowResult
+from .config import configure_logging, install_uvloop
+from .queue import QueueManager
+from .workflow import BaseWorkflow, WorkflowConfig, WorkflowResult
 
 logger = structlog.get_logger()
 
+# Metrics live in the process-wide registry, which rejects a second
+# registration, so every processor shares one set
+WORKFLOW_EXECUTIONS = Counter(
+    'workflow_executions_total',
+    'Total number of workflow executions',
+    ['workflow_name', 'status']
+)
+QUEUE_SIZE = Gauge(
+    'workflow_queue_size',
+    'Current size of workflow queue',
+    ['workflow_name']
+)
+
 class WorkflowProcessor:
     """Processes workflows from the queue."""
 
-    def __init__(self, queue_manager):
+    def __init__(
+        self,
+        queue_manager,
+        max_concurrency: int = 64,
+        batch_size: int = 64
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         self.queue_manager = queue_manager
         self.workflows: Dict[str, Type[BaseWorkflow]] = {}
+        self.workflow_configs: Dict[str, WorkflowConfig] = {}
         self._logger = logger.bind(component="workflow_processor")
         self._running = False
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.batch_size = batch_size
+        self._inflight: Set[asyncio.Task] = set()
 
         # Metrics
-        self.workflow_executions = Counter(
-            'workflow_executions_total',
-            'Total number of workflow executions',
-            ['workflow_name', 'status']
-        )
-        self.queue_size = Gauge(
-            'workflow_queue_size',
-            'Current size of workflow queue',
-            ['workflow_name']
-        )
-
-    def register_workflow(self, workflow_class: Type[BaseWorkflow]) -> None:
-        """Register a workflow class."""
-        workflow_name = workflow_class.__name__
+        self.workflow_executions = WORKFLOW_EXECUTIONS
+        self.queue_size = QUEUE_SIZE
+
+    def register_workflow(
+        self,
+        workflow_class: Type[BaseWorkflow],
+        config: Optional[WorkflowConfig] = None
+    ) -> None:
+        """Register a workflow class.
+
+        Args:
+            workflow_class: Workflow to run for items on its queue
+            config: Configuration each run is built with; defaults to the
+                config class the workflow's __init__ is annotated with,
+                using its defaults and the workflow class name as its name
+        """
+        workflow_name = sys.intern(workflow_class.__name__)
+        if self.workflows.get(workflow_name) is workflow_class:
+            return
+        if config is None:
+            config = _default_config(workflow_class, workflow_name)
         self.workflows[workflow_name] = workflow_class
+        self.workflow_configs[workflow_name] = config
         self._logger.info("workflow_registered", workflow=workflow_name)
 
     async def start(self) -> None:
@@ -42,80 +79,150 @@ class WorkflowProcessor:
         self._running = True
         self._logger.info("processor_started")
 
+        workflow_names = list(self.workflows)
+        if not workflow_names:
+            self._logger.warning("no_workflows_registered")
+            return
+
         while self._running:
-            for workflow_name, workflow_class in self.workflows.items():
-                try:
-                    # Get data from queue
-                    data = await self.queue_manager.dequeue(workflow_name)
-                    if not data:
-                        continue
-
-                    # Update queue size metric
-                    self.queue_size.labels(workflow_name=workflow_name).set(
-                        await self.queue_manager.get_queue_size(workflow_name)
-                    )
-
-                    # Execute workflow
-                    workflow = workflow_class(data)
-                    result = await workflow.execute()
-
-                    # Update metrics
-                    self.workflow_executions.labels(
-                        workflow_name=workflow_name,
-                        status='success' if result.success else 'failure'
-                    ).inc()
-
-                    if not result.success:
-                        self._logger.error(
-                            "workflow_failed",
-                            workflow=workflow_name,
-                            error=result.error
-                        )
-
-                except Exception as e:
-                    self._logger.error(
-                        "processor_error",
-                        workflow=workflow_name,
-                        error=str(e)
-                    )
-
-            await asyncio.sleep(1)  # Prevent tight loop
+            workflow_name = None
+            try:
+                # Block until any workflow queue has data
+                popped = await self.queue_manager.dequeue_any(workflow_names)
+                if not popped:
+                    continue
+                workflow_name, item = popped
+                await self._dispatch(workflow_name, item)
+
+                # Drain whatever else is waiting on that queue in one round-trip
+                batch = await self.queue_manager.dequeue_batch(
+                    workflow_name,
+                    self.batch_size
+                )
+                for item in batch:
+                    await self._dispatch(workflow_name, item)
+
+            except Exception as e:
+                self._logger.error(
+                    "processor_error",
+                    workflow=workflow_name,
+                    error=str(e)
+                )
+                await asyncio.sleep(1)  # Back off before retrying
+
+        # Let running workflows finish before returning
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _dispatch(self, workflow_name: str, item: Dict[str, Any]) -> None:
+        """Wait for a free slot, then run the workflow concurrently."""
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._run_one(workflow_name, item))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run_one(self, workflow_name: str, item: Dict[str, Any]) -> None:
+        """Execute a single dequeued workflow and record its metrics."""
+        success = False
+        try:
+            # Update queue size metric
+            self.queue_size.labels(workflow_name=workflow_name).set(
+                await self.queue_manager.get_queue_size(workflow_name)
+            )
+
+            # Execute workflow
+            workflow_class = self.workflows[workflow_name]
+            workflow = workflow_class(self.workflow_configs[workflow_name])
+            result = await workflow.execute(item["data"])
+            success = result.success
+
+            if not result.success:
+                self._logger.error(
+                    "workflow_failed",
+                    workflow=workflow_name,
+                    error=result.error
+                )
+
+        except Exception as e:
+            self._logger.error(
+                "processor_error",
+                workflow=workflow_name,
+                error=str(e)
+            )
+        finally:
+            # Update metrics
+            self.workflow_executions.labels(
+                workflow_name=workflow_name,
+                status='success' if success else 'failure'
+            ).inc()
+            self._semaphore.release()
 
     def stop(self) -> None:
         """Stop processing workflows."""
         self._running = False
         self._logger.info("processor_stopped")
 
-    def load_workflows(self, workflows_dir: str) -> None:
-        """Load workflow classes from a directory."""
-        for filename in os.listdir(workflows_dir):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                module_name = filename[:-3]
-                module = importlib.import_module(f'workflows.{module_name}')
-                
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        issubclass(attr, BaseWorkflow) and 
-                        attr != BaseWorkflow):
-                        self.register_workflow(attr)
+    def load_workflows(self, workflows_dir: str, package: Optional[str] = None) -> None:
+        """Load workflow classes from a directory.
+
+        Args:
+            workflows_dir: Directory containing workflow modules
+            package: Import prefix for those modules; derived from the
+                directory's path relative to the working directory if omitted,
+                e.g. "src/workflows" -> "src.workflows"
+        """
+        if package is None:
+            package = os.path.relpath(workflows_dir).replace(os.sep, ".")
+        with os.scandir(workflows_dir) as entries:
+            module_names = [
+                entry.name[:-3] for entry in entries
+                if entry.name.endswith('.py')
+                and not entry.name.startswith('__')
+                and entry.is_file()
+            ]
+
+        for module_name in module_names:
+            module = importlib.import_module(f'{package}.{module_name}')
+            
+            # Only register classes defined in the module, not imported ones
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if (cls.__module__ == module.__name__ and
+                    issubclass(cls, BaseWorkflow) and
+                    cls is not BaseWorkflow):
+                    self.register_workflow(cls)
+
+def _default_config(workflow_class: Type[BaseWorkflow], workflow_name: str) -> WorkflowConfig:
+    """Build a workflow's default config from its __init__ annotation."""
+    config_class = typing.get_type_hints(workflow_class.__init__).get("config")
+    if not (inspect.isclass(config_class) and issubclass(config_class, WorkflowConfig)):
+        config_class = WorkflowConfig
+    if config_class.model_fields["name"].is_required():
+        return config_class(name=workflow_name)
+    return config_class()
 
 async def main():
     """Main entry point for the workflow processor."""
+    configure_logging()
+
     # Initialize queue manager
     redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
-    queue_manager = QueueManager(redis_url)
-    await queue_manager.connect()
+    queue_manager = QueueManager({"default": redis_url})
+    await queue_manager.ensure_connected()
 
     # Load and start processor
     processor = WorkflowProcessor(queue_manager)
     
     try:
+        await asyncio.to_thread(
+            processor.load_workflows,
+            os.getenv('WORKFLOWS_DIR', 'src/workflows')
+        )
         await processor.start()
     except KeyboardInterrupt:
-        await processor.stop()
+        processor.stop()
     finally:
-        await queue_manager.disconnect()
+        await queue_manager.disconnect_all()
 
 if __name__ == '__main__':
+    install_uvloop()
     asyncio.run(main()) 
\ No newline at end of file
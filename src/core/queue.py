@@ -1,9 +1,9 @@
-from typing import Any, Dict, Optional, List
-from datetime import datetime
-import json
+from typing import Any, Dict, Optional, List, Tuple
 import os
+import time
 
 import aioredis
+import orjson
 import structlog
 
 from src.core.config import get_redis_config
@@ -29,6 +29,9 @@ class QueueManager:
             name: None for name in redis_configs
         }
         self._logger = logger.bind(component="queue_manager")
+        self._queue_loggers = {
+            name: self._logger.bind(queue=name) for name in redis_configs
+        }
         
         # Load max_queue_length from config.json
         redis_config = get_redis_config()
@@ -51,15 +54,32 @@ class QueueManager:
             raise ValueError(f"Queue {queue_name} not configured")
             
         if not self.redis_connections[queue_name]:
+            # Keep payloads as bytes; orjson parses them without a decode step
             self.redis_connections[queue_name] = await aioredis.from_url(
-                self.redis_configs[queue_name]
+                self.redis_configs[queue_name],
+                decode_responses=False
             )
             self._logger.info("redis_connected", queue=queue_name)
 
+    async def ensure_connected(self) -> None:
+        """Connect to all configured Redis instances up front."""
+        for queue_name in self.redis_configs:
+            await self.connect(queue_name)
+
+    def _get_connection(self, queue_name: str) -> aioredis.Redis:
+        """Get the open connection for a queue without awaiting."""
+        conn = self.redis_connections.get(queue_name)
+        if conn is None:
+            if queue_name not in self.redis_configs:
+                raise ValueError(f"Queue {queue_name} not configured")
+            raise RuntimeError(f"Queue {queue_name} not connected")
+        return conn
+
     async def disconnect(self, queue_name: str = "default") -> None:
         """Disconnect from a specific Redis instance."""
-        if self.redis_connections[queue_name]:
-            await self.redis_connections[queue_name].close()
+        conn = self.redis_connections[queue_name]
+        if conn:
+            await conn.close()
             self.redis_connections[queue_name] = None
             self._logger.info("redis_disconnected", queue=queue_name)
 
@@ -75,54 +95,123 @@ class QueueManager:
         queue_name: str = "default"
     ) -> bool:
         """Add a workflow to the specified queue."""
-        if queue_name not in self.redis_configs:
-            raise ValueError(f"Queue {queue_name} not configured")
-
-        await self.connect(queue_name)
-        
+        conn = self._get_connection(queue_name)
         queue_key = f"workflow:{workflow_name}:queue"
         item = {
             "data": data,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.time_ns(),
             "queue": queue_name
         }
 
-        await self.redis_connections[queue_name].rpush(
-            queue_key,
-            json.dumps(item)
-        )
-        # Enforce max queue length (FIFO) using LTRIM
-        await self.redis_connections[queue_name].ltrim(queue_key, -self.max_queue_length, -1)
-        queue_len = await self.redis_connections[queue_name].llen(queue_key)
-        self._logger.info(
+        # Push and enforce max queue length (FIFO) using LTRIM in one round-trip
+        pipe = conn.pipeline(transaction=False)
+        pipe.rpush(queue_key, orjson.dumps(item))
+        pipe.ltrim(queue_key, -self.max_queue_length, -1)
+        pushed_len, _ = await pipe.execute()
+        queue_len = min(pushed_len, self.max_queue_length)
+        self._queue_loggers[queue_name].debug(
             "item_enqueued",
             workflow=workflow_name,
-            queue=queue_name,
             queue_length=queue_len
         )
         return True
 
+    async def enqueue_batch(
+        self,
+        workflow_name: str,
+        items: List[Dict[str, Any]],
+        queue_name: str = "default"
+    ) -> bool:
+        """Add several workflow items to the specified queue in one round-trip."""
+        if not items:
+            return True
+
+        conn = self._get_connection(queue_name)
+        queue_key = f"workflow:{workflow_name}:queue"
+        timestamp = time.time_ns()
+        payloads = [
+            orjson.dumps({"data": data, "timestamp": timestamp, "queue": queue_name})
+            for data in items
+        ]
+
+        pipe = conn.pipeline(transaction=False)
+        pipe.rpush(queue_key, *payloads)
+        pipe.ltrim(queue_key, -self.max_queue_length, -1)
+        pushed_len, _ = await pipe.execute()
+        self._queue_loggers[queue_name].debug(
+            "batch_enqueued",
+            workflow=workflow_name,
+            batch_size=len(items),
+            queue_length=min(pushed_len, self.max_queue_length)
+        )
+        return True
+
     async def dequeue(
         self,
         workflow_name: str,
         queue_name: str = "default"
     ) -> Optional[Dict[str, Any]]:
         """Get the next workflow from the specified queue."""
-        if queue_name not in self.redis_configs:
-            raise ValueError(f"Queue {queue_name} not configured")
-
-        await self.connect(queue_name)
-        
+        conn = self._get_connection(queue_name)
         queue_key = f"workflow:{workflow_name}:queue"
-        item = await self.redis_connections[queue_name].lpop(queue_key)
+        item = await conn.lpop(queue_key)
 
         if item:
-            self._logger.info(
+            self._queue_loggers[queue_name].debug(
                 "item_dequeued",
+                workflow=workflow_name
+            )
+            return orjson.loads(item)
+        return None
+
+    async def dequeue_batch(
+        self,
+        workflow_name: str,
+        max_items: int,
+        queue_name: str = "default"
+    ) -> List[Dict[str, Any]]:
+        """Atomically pop up to max_items from the front of a workflow queue."""
+        if max_items <= 0:
+            return []  # LRANGE 0 -1 would return, but not remove, the whole list
+
+        conn = self._get_connection(queue_name)
+        queue_key = f"workflow:{workflow_name}:queue"
+
+        pipe = conn.pipeline(transaction=True)
+        pipe.lrange(queue_key, 0, max_items - 1)
+        pipe.ltrim(queue_key, max_items, -1)
+        items, _ = await pipe.execute()
+
+        if items:
+            self._queue_loggers[queue_name].debug(
+                "batch_dequeued",
                 workflow=workflow_name,
-                queue=queue_name
+                batch_size=len(items)
             )
-            return json.loads(item)
+        return [orjson.loads(item) for item in items]
+
+    async def dequeue_any(
+        self,
+        workflow_names: List[str],
+        timeout: int = 5,
+        queue_name: str = "default"
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Block until any of the workflows' queues has an item.
+
+        Returns a (workflow_name, item) tuple, or None if the timeout expires.
+        """
+        conn = self._get_connection(queue_name)
+        queue_keys = [f"workflow:{name}:queue" for name in workflow_names]
+        popped = await conn.blpop(queue_keys, timeout=timeout)
+
+        if popped:
+            queue_key, item = popped
+            workflow_name = queue_key.decode()[len("workflow:"):-len(":queue")]
+            self._queue_loggers[queue_name].debug(
+                "item_dequeued",
+                workflow=workflow_name
+            )
+            return workflow_name, orjson.loads(item)
         return None
 
     async def get_queue_size(
@@ -131,13 +220,9 @@ class QueueManager:
         queue_name: str = "default"
     ) -> int:
         """Get the current size of a workflow queue."""
-        if queue_name not in self.redis_configs:
-            raise ValueError(f"Queue {queue_name} not configured")
-
-        await self.connect(queue_name)
-        
+        conn = self._get_connection(queue_name)
         queue_key = f"workflow:{workflow_name}:queue"
-        return await self.redis_connections[queue_name].llen(queue_key)
+        return await conn.llen(queue_key)
 
     async def get_all_queue_sizes(self, workflow_name: str) -> Dict[str, int]:
         """Get sizes of a workflow's queues across all Redis instances."""
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
-from datetime import datetime
+import asyncio
+import time
 
 import structlog
 from pydantic import BaseModel
@@ -27,36 +28,38 @@ class BaseWorkflow(ABC):
         self.config = config
         self.retry_count = 0
         self._logger = logger.bind(workflow_name=config.name)
-        self.start_time = datetime.now()
 
     async def execute(self, data: Dict[str, Any]) -> WorkflowResult:
         """Execute the workflow with the given data."""
-        self._logger.info("workflow_started", data_size=len(str(data)))
+        self._logger.info("workflow_started", key_count=len(data))
+        start_time = time.monotonic()
 
-        try:
-            result = await self.process(data)
-            execution_time = (datetime.now() - self.start_time).total_seconds()
-            
-            return WorkflowResult(
-                success=True,
-                data=result,
-                execution_time=execution_time
-            )
+        error = None
+        for attempt in range(self.config.max_retries + 1):
+            if attempt:
+                self._logger.info("retrying_workflow", attempt=attempt)
+                # Exponential backoff: 0.1s, 0.2s, 0.4s, ... capped at 5s
+                await asyncio.sleep(min(0.1 * 2 ** (attempt - 1), 5))
+            # Retries used by the latest call, for reporting only
+            self.retry_count = attempt
 
-        except Exception as e:
-            self._logger.error("workflow_failed", error=str(e))
-            execution_time = (datetime.now() - self.start_time).total_seconds()
-            
-            if self.retry_count < self.config.max_retries:
-                self.retry_count += 1
-                self._logger.info("retrying_workflow", attempt=self.retry_count)
-                return await self.execute(data)
+            try:
+                result = await self.process(data)
+                return WorkflowResult(
+                    success=True,
+                    data=result,
+                    execution_time=time.monotonic() - start_time
+                )
 
-            return WorkflowResult(
-                success=False,
-                error=str(e),
-                execution_time=execution_time
-            )
+            except Exception as e:
+                self._logger.error("workflow_failed", error=str(e))
+                error = e
+
+        return WorkflowResult(
+            success=False,
+            error=str(error),
+            execution_time=time.monotonic() - start_time
+        )
 
     @abstractmethod
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,32 +1,83 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set
 import structlog
-import json
+import orjson
 import asyncio
+import time
 import websockets
 from datetime import datetime
 from pydantic import BaseModel
 
 from src.core.workflow import BaseWorkflow, WorkflowResult, WorkflowConfig
 from src.core.queue import QueueManager
-from src.core.config import get_workflow_config, is_redis_enabled
+from src.core.config import (
+    configure_logging,
+    get_workflow_config,
+    install_uvloop,
+    is_redis_enabled,
+)
 
 logger = structlog.get_logger()
 
+# Processed messages are buffered and pushed to Redis in batches of up to
+# ENQUEUE_BATCH_SIZE, or after ENQUEUE_FLUSH_INTERVAL seconds, whichever is first
+ENQUEUE_BATCH_SIZE = 32
+ENQUEUE_FLUSH_INTERVAL = 0.05
+# Messages kept for retry while Redis is unreachable; older ones are dropped
+MAX_PENDING = 1024
+
+class BinanceOptions(BaseModel):
+    """Stream and rate limit options for the Binance workflow."""
+    symbols: List[str] = ["btcusdt", "ethusdt"]  # Default symbols to track
+    streams: List[str] = ["aggTrade", "markPrice"]  # Default streams to subscribe to
+    rate_limit: int = 10  # Messages per second
+    rate_limit_window: float = 1.0  # Window size in seconds
+
 class BinanceWebSocketConfig(WorkflowConfig):
     """Configuration for the Binance workflow."""
     name: str = "binance"
     description: str = "Fetches and processes cryptocurrency data from Binance Futures WebSocket"
     enabled: bool = True
     interval: int = 0  # WebSocket is real-time
-    options: Dict[str, Any] = {
-        "symbols": ["btcusdt", "ethusdt"],  # Default symbols to track
-        "streams": ["aggTrade", "markPrice"],  # Default streams to subscribe to
-        "rate_limit": 10,  # Messages per second
-        "rate_limit_window": 1.0,  # Window size in seconds
+    options: BinanceOptions = BinanceOptions()
+
+def _process_trade(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Process an aggTrade stream payload."""
+    return {
+        "type": "trade",
+        "symbol": payload.get("s"),
+        "price": float(payload.get("p", 0)),
+        "quantity": float(payload.get("q", 0)),
+        "timestamp": payload.get("T"),
+        "is_buyer_maker": payload.get("m", False)
+    }
+
+def _process_mark_price(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Process a markPrice stream payload."""
+    return {
+        "type": "mark_price",
+        "symbol": payload.get("s"),
+        "price": float(payload.get("p", 0)),
+        "index_price": float(payload.get("i", 0)),
+        "funding_rate": float(payload.get("r", 0)),
+        "next_funding_time": payload.get("T"),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+def _process_unknown(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Pass through a payload from an unrecognised stream."""
+    return {
+        "type": "unknown",
+        "raw_data": payload
     }
 
 class BinanceWebSocketWorkflow(BaseWorkflow):
     """Workflow for processing cryptocurrency data from Binance Futures WebSocket."""
+
+    # Payload handlers keyed by stream type
+    _STREAM_HANDLERS = {
+        "aggTrade": _process_trade,
+        "markPrice": _process_mark_price,
+    }
     
     def __init__(self, config: BinanceWebSocketConfig):
         super().__init__(config)
@@ -36,19 +87,28 @@ class BinanceWebSocketWorkflow(BaseWorkflow):
         workflow_config = get_workflow_config("binance")
         if workflow_config:
             self.config = workflow_config
-            self.options = workflow_config.config
+            self.options = BinanceOptions.model_validate(workflow_config.config)
         else:
             self.config = config
             self.options = config.options
             
-        self.last_pong = datetime.utcnow()
-        self.message_count = 0
-        self.last_reset = datetime.utcnow()
-        self.rate_limit = self.options.get("rate_limit", 10)
-        self.rate_limit_window = self.options.get("rate_limit_window", 1.0)
+        self.rate_limit = self.options.rate_limit
+        self.rate_limit_window = self.options.rate_limit_window
+        # Token bucket holding up to rate_limit tokens, refilled continuously
+        self._refill_rate = self.rate_limit / self.rate_limit_window
+        self._tokens = float(self.rate_limit)
+        self._last_refill = time.monotonic()
         self._websocket = None
         self._last_data = None
         self._is_running = False
+
+        # Build combined stream URL once; reconnects reuse it
+        streams = [
+            f"{symbol}@{stream_type}"
+            for symbol in self.options.symbols
+            for stream_type in self.options.streams
+        ]
+        self._stream_url = f"wss://fstream.binance.com/stream?streams={'/'.join(streams)}"
         
         # Initialize queue manager if Redis is enabled
         if is_redis_enabled() and self.config.use_redis:
@@ -58,19 +118,34 @@ class BinanceWebSocketWorkflow(BaseWorkflow):
             })
         else:
             self._queue_manager = None
+        self._queue_ready = False
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Background tasks owned by this workflow, cancelled on cleanup
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def _connect_queue(self) -> bool:
+        """Connect to Redis, independently of the WebSocket."""
+        try:
+            await self._queue_manager.ensure_connected()
+            return True
+        except Exception as e:
+            self._logger.error("redis_connect_error", error=str(e))
+            return False
 
     async def _connect_websocket(self):
         """Connect to Binance Futures WebSocket."""
-        # Build combined stream URL
-        streams = []
-        for symbol in self.options["symbols"]:
-            for stream_type in self.options["streams"]:
-                streams.append(f"{symbol}@{stream_type}")
-        
-        stream_url = f"wss://fstream.binance.com/stream?streams={'/'.join(streams)}"
-        
         try:
-            self._websocket = await websockets.connect(stream_url)
+            # Frames are small JSON objects: skip permessage-deflate and keep
+            # the receive buffers bounded
+            self._websocket = await websockets.connect(
+                self._stream_url,
+                compression=None,
+                max_size=2**16,
+                max_queue=256,
+                ping_interval=20,
+                ping_timeout=20
+            )
             self._logger.info("Connected to Binance Futures WebSocket")
             return True
         except Exception as e:
@@ -79,32 +154,26 @@ class BinanceWebSocketWorkflow(BaseWorkflow):
 
     async def _fetch_data(self) -> Dict[str, Any]:
         """Fetch data from WebSocket."""
-        if not self._websocket:
-            if not await self._connect_websocket():
-                return {"type": "error", "error": "Failed to connect to WebSocket"}
+        # Ping/pong control frames are answered by the websockets library,
+        # so only data frames and reconnects need handling here
+        while True:
+            if not self._websocket:
+                if not await self._connect_websocket():
+                    return {"type": "error", "error": "Failed to connect to WebSocket"}
 
-        try:
-            # Set a timeout for receiving data
-            message = await asyncio.wait_for(self._websocket.recv(), timeout=5.0)
-            data = json.loads(message)
-            
-            # Handle ping messages
-            if isinstance(data, str) and data == "ping":
-                await self._websocket.pong()
-                self.last_pong = datetime.utcnow()
-                return await self._fetch_data()  # Try again after ping
-            
-            return data
-        except asyncio.TimeoutError:
-            self._logger.warning("Timeout waiting for WebSocket data")
-            return {"type": "error", "error": "Timeout waiting for data"}
-        except websockets.exceptions.ConnectionClosed:
-            self._logger.warning("WebSocket connection closed, reconnecting...")
-            self._websocket = None
-            return await self._fetch_data()  # Try again with new connection
-        except Exception as e:
-            self._logger.error(f"Error fetching data: {str(e)}")
-            return {"type": "error", "error": str(e)}
+            try:
+                # Set a timeout for receiving data
+                message = await asyncio.wait_for(self._websocket.recv(), timeout=5.0)
+                return orjson.loads(message)
+            except asyncio.TimeoutError:
+                self._logger.warning("Timeout waiting for WebSocket data")
+                return {"type": "error", "error": "Timeout waiting for data"}
+            except websockets.exceptions.ConnectionClosed:
+                self._logger.warning("WebSocket connection closed, reconnecting...")
+                self._websocket = None
+            except Exception as e:
+                self._logger.error(f"Error fetching data: {str(e)}")
+                return {"type": "error", "error": str(e)}
 
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process cryptocurrency data from Binance Futures WebSocket."""
@@ -117,40 +186,18 @@ class BinanceWebSocketWorkflow(BaseWorkflow):
                 stream_name = "unknown"
                 payload = data
 
-            # Process based on stream type
-            processed_data = None
-            if "@aggTrade" in stream_name:
-                processed_data = {
-                    "type": "trade",
-                    "symbol": payload.get("s"),
-                    "price": float(payload.get("p", 0)),
-                    "quantity": float(payload.get("q", 0)),
-                    "timestamp": payload.get("T"),
-                    "is_buyer_maker": payload.get("m", False)
-                }
-            elif "@markPrice" in stream_name:
-                processed_data = {
-                    "type": "mark_price",
-                    "symbol": payload.get("s"),
-                    "price": float(payload.get("p", 0)),
-                    "index_price": float(payload.get("i", 0)),
-                    "funding_rate": float(payload.get("r", 0)),
-                    "next_funding_time": payload.get("T"),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                processed_data = {
-                    "type": "unknown",
-                    "raw_data": payload
-                }
-
-            # Queue the processed data if Redis is enabled
-            if self._queue_manager and self.config.use_redis:
-                await self._queue_manager.enqueue(
-                    "binance",  # Use hardcoded workflow name
-                    processed_data,
-                    self.config.redis_queue
-                )
+            # Dispatch on stream type, e.g. "btcusdt@markPrice@1s" -> "markPrice"
+            stream_type = stream_name.partition("@")[2].partition("@")[0]
+            handler = self._STREAM_HANDLERS.get(stream_type, _process_unknown)
+            processed_data = handler(payload)
+
+            # Buffer the processed data for Redis if enabled
+            if self._queue_manager and self.config.use_redis and self._queue_ready:
+                self._pending.append(processed_data)
+                if len(self._pending) >= ENQUEUE_BATCH_SIZE:
+                    await self._flush_pending()
+                elif self._flush_task is None:
+                    self._flush_task = self._create_task(self._flush_after_interval())
 
             return processed_data
         except Exception as e:
@@ -161,25 +208,65 @@ class BinanceWebSocketWorkflow(BaseWorkflow):
                 "raw_data": data
             }
 
+    def _create_task(self, coro) -> asyncio.Task:
+        """Start a background task tracked for cancellation in cleanup."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_pending(self) -> None:
+        """Push all buffered messages to Redis in one pipelined call."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            await self._queue_manager.enqueue_batch(
+                "binance",  # Use hardcoded workflow name
+                batch,
+                self.config.redis_queue
+            )
+        except BaseException:
+            # Keep the batch so a later flush or cleanup can still push it
+            self._pending[:0] = batch
+            overflow = len(self._pending) - MAX_PENDING
+            if overflow > 0:
+                del self._pending[:overflow]
+                self._logger.error("enqueue_dropped", count=overflow)
+            raise
+
+    async def _flush_after_interval(self) -> None:
+        """Flush buffered messages once the flush interval has passed."""
+        try:
+            await asyncio.sleep(ENQUEUE_FLUSH_INTERVAL)
+            self._flush_task = None
+            await self._flush_pending()
+        except Exception as e:
+            self._logger.error("enqueue_flush_error", error=str(e))
+        finally:
+            # A newer timer may have been scheduled while this one flushed
+            if self._flush_task is asyncio.current_task():
+                self._flush_task = None
+
     async def execute(self, data: Dict[str, Any]) -> WorkflowResult:
         """Execute the workflow with the given data."""
         try:
-            # Rate limiting check
-            current_time = datetime.utcnow()
-            time_diff = (current_time - self.last_reset).total_seconds()
-            
-            if time_diff >= self.rate_limit_window:
-                self.message_count = 0
-                self.last_reset = current_time
-            
-            self.message_count += 1
-            if self.message_count > self.rate_limit:
-                wait_time = self.rate_limit_window - time_diff
-                if wait_time > 0:
-                    self._logger.warning(f"Rate limit exceeded, waiting {wait_time:.2f}s...")
-                    await asyncio.sleep(wait_time)
-                self.message_count = 0
-                self.last_reset = datetime.utcnow()
+            # Rate limiting: take a token, waiting for the refill if none are left
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit,
+                self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait_time = -self._tokens / self._refill_rate
+                self._logger.debug("rate_limited", wait_time=wait_time)
+                await asyncio.sleep(wait_time)
+
+            # A Redis outage only stops queueing, not fetching market data
+            if self._queue_manager and not self._queue_ready:
+                self._queue_ready = await self._connect_queue()
 
             # Fetch live data
             websocket_data = await self._fetch_data()
@@ -197,24 +284,32 @@ class BinanceWebSocketWorkflow(BaseWorkflow):
     async def cleanup(self):
         """Clean up WebSocket connection."""
         self._is_running = False
+
+        # Stop this workflow's own background tasks
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        # Push any buffered messages before tearing down
+        if self._queue_manager:
+            try:
+                await self._flush_pending()
+            except Exception as e:
+                self._logger.error("enqueue_flush_error", error=str(e))
+
         if self._websocket:
             try:
-                # Close the WebSocket connection
+                # Close the WebSocket connection (waits for the closing handshake)
                 await self._websocket.close()
-                # Wait for the connection to be fully closed
-                await asyncio.sleep(0.1)
             except Exception as e:
                 self._logger.error(f"Error closing WebSocket: {str(e)}")
             finally:
                 self._websocket = None
-                # Cancel any pending tasks
-                for task in asyncio.all_tasks():
-                    if task != asyncio.current_task():
-                        task.cancel()
         
         # Disconnect from Redis if enabled
         if self._queue_manager:
             await self._queue_manager.disconnect_all()
+            self._queue_ready = False
 
 async def run_binance_workflow():
     """Run the Binance workflow with real-time data."""
@@ -230,7 +325,7 @@ async def run_binance_workflow():
             result = await workflow.execute({})
             if result.success:
                 print("\nBinance Futures Data:")
-                print(json.dumps(result.data, indent=2))
+                print(orjson.dumps(result.data, option=orjson.OPT_INDENT_2).decode())
                 
                 # Print queue size if Redis is enabled
                 if workflow._queue_manager and workflow.config.use_redis:
@@ -251,6 +346,8 @@ async def run_binance_workflow():
         await workflow.cleanup()
 
 if __name__ == "__main__":
+    install_uvloop()
+    configure_logging()
     try:
         asyncio.run(run_binance_workflow())
     except KeyboardInterrupt:
@@ -1,114 +1,256 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from collections import OrderedDict
 import structlog
 from datetime import datetime
 import asyncio
 import aiohttp
-import feedparser
 from bs4 import BeautifulSoup
 import re
+import html.entities
+import xml.etree.ElementTree as ET
+from pydantic import BaseModel
 
+from src.core.http_session import HTTPSession
 from src.core.workflow import BaseWorkflow, WorkflowResult, WorkflowConfig
+from src.core.config import configure_logging, install_uvloop
 
 logger = structlog.get_logger()
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# XML namespaces used by RSS content:encoded, Dublin Core dates, RSS 1.0 (RDF)
+# and Atom feeds
+_CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+_RSS1_NS = "{http://purl.org/rss/1.0/}"
+_RDF_NS = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# Named entity references; XML itself only defines the five below
+_ENTITY_RE = re.compile(rb"&([A-Za-z][A-Za-z0-9]*);")
+_XML_ENTITIES = {b"amp", b"lt", b"gt", b"quot", b"apos"}
+
+
+def _replace_html_entity(match: "re.Match[bytes]") -> bytes:
+    """Turn an HTML named entity into a numeric reference XML accepts."""
+    name = match.group(1)
+    if name in _XML_ENTITIES:
+        return match.group(0)
+    codepoint = html.entities.name2codepoint.get(name.decode("ascii"))
+    if codepoint is None:
+        return b"&amp;" + name + b";"  # Unknown entity, keep it as literal text
+    return b"&#%d;" % codepoint
+
+
+# Upper bound on remembered entry IDs, oldest are forgotten first
+MAX_PROCESSED_ENTRIES = 50000
+
+class NewsOptions(BaseModel):
+    """Feed and keyword options for the news RSS workflow."""
+    feeds: List[str] = [
+        "https://feeds.content.dowjones.io/public/rss/mw_topstories"
+    ]
+    keywords: List[str] = [
+        "stock", "market", "trading", "invest", "earnings",
+        "revenue", "profit", "loss", "acquisition", "merger",
+        "S&P 500", "Dow Jones", "Nasdaq", "IPO", "cryptocurrency",
+        "interest rate", "Federal Reserve", "inflation", "economy"
+    ]
+
 class NewsRSSConfig(WorkflowConfig):
     """Configuration for news RSS workflow."""
     name: str = "news_rss"
     enabled: bool = True
     interval: int = 1800  # 30 minutes
-    options: Dict[str, Any] = {
-        "feeds": [
-            "https://feeds.content.dowjones.io/public/rss/mw_topstories"
-        ],
-        "keywords": [
-            "stock", "market", "trading", "invest", "earnings",
-            "revenue", "profit", "loss", "acquisition", "merger",
-            "S&P 500", "Dow Jones", "Nasdaq", "IPO", "cryptocurrency",
-            "interest rate", "Federal Reserve", "inflation", "economy"
-        ]
-    }
+    options: NewsOptions = NewsOptions()
 
 class NewsRSSWorkflow(BaseWorkflow):
     """Workflow for processing news RSS feeds."""
     
-    def __init__(self, config: NewsRSSConfig):
+    def __init__(
+        self,
+        config: NewsRSSConfig,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize the news RSS workflow.
+
+        Args:
+            config: Workflow configuration
+            session: Optional shared HTTP session, see HTTPSession
+        """
         super().__init__(config)
         self._logger = logger.bind(workflow="news_rss")
-        self.feeds = config.options.get("feeds", [])
-        self.keywords = config.options.get("keywords", [])
-        self.processed_entries = set()
+        self.feeds = config.options.feeds
+        self.keywords = config.options.keywords
+        # Lowercase keywords once rather than for every article
+        self._keyword_pairs = [(keyword, keyword.lower()) for keyword in self.keywords]
+        self.processed_entries: OrderedDict[str, None] = OrderedDict()
+        self._http = HTTPSession(session)
 
     def _clean_text(self, text: str) -> str:
         """Clean HTML and normalize text."""
         if not text:
             return ""
-        # Remove HTML tags
-        soup = BeautifulSoup(text, "html.parser")
-        text = soup.get_text()
+        # Remove HTML tags and entities (plain text needs no parsing)
+        if "<" in text or "&" in text:
+            text = BeautifulSoup(text, "html.parser").get_text()
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return _WHITESPACE_RE.sub(' ', text).strip()
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract relevant keywords from text."""
-        found_keywords = []
         text_lower = text.lower()
-        for keyword in self.keywords:
-            if keyword.lower() in text_lower:
-                found_keywords.append(keyword)
-        return found_keywords
+        return [
+            keyword for keyword, keyword_lower in self._keyword_pairs
+            if keyword_lower in text_lower
+        ]
 
     async def _fetch_feed(self, feed_url: str) -> List[Dict[str, Any]]:
         """Fetch and parse RSS feed."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(feed_url) as response:
-                if response.status != 200:
-                    self._logger.error(
-                        "feed_fetch_error",
-                        url=feed_url,
-                        status=response.status
-                    )
-                    return []
-                
-                content = await response.text()
-                feed = feedparser.parse(content)
-                
-                entries = []
-                for entry in feed.entries:
-                    # Skip if already processed
-                    if entry.id in self.processed_entries:
-                        continue
-                    
-                    # Clean and process entry
-                    title = self._clean_text(entry.title)
-                    description = self._clean_text(entry.description if hasattr(entry, 'description') else "")
-                    content = self._clean_text(entry.content[0].value if hasattr(entry, 'content') else "")
-                    
-                    # Extract keywords
-                    all_text = f"{title} {description} {content}"
-                    keywords = self._extract_keywords(all_text)
-                    
-                    if keywords:  # Only include entries with relevant keywords
-                        entries.append({
-                            "id": entry.id,
-                            "title": title,
-                            "description": description,
-                            "link": entry.link,
-                            "published": entry.published if hasattr(entry, 'published') else datetime.utcnow().isoformat(),
-                            "keywords": keywords,
-                            "source": "MarketWatch"
-                        })
-                        self.processed_entries.add(entry.id)
-                
-                return entries
+        session = await self._http.get()
+        async with session.get(feed_url) as response:
+            if response.status != 200:
+                self._logger.error(
+                    "feed_fetch_error",
+                    url=feed_url,
+                    status=response.status
+                )
+                return []
+            
+            # Hand raw bytes to the XML parser, which decodes them itself
+            # according to the document's encoding declaration
+            content = await response.read()
+
+        try:
+            feed_entries = self._parse_feed(content)
+        except ET.ParseError as e:
+            self._logger.error("feed_parse_error", url=feed_url, error=str(e))
+            return []
+        if not feed_entries:
+            self._logger.warning("feed_no_entries_recognised", url=feed_url)
+            return []
+        
+        # Entries without a publish date share one fetch-time timestamp
+        fetched_at = datetime.utcnow().isoformat()
+        entries = []
+        for entry in feed_entries:
+            # Skip if already processed
+            entry_id = entry["id"]
+            if not entry_id:
+                continue
+            if entry_id in self.processed_entries:
+                self.processed_entries.move_to_end(entry_id)
+                continue
+            
+            # Clean and process entry
+            title = self._clean_text(entry["title"])
+            description = self._clean_text(entry["description"])
+            content = self._clean_text(entry["content"])
+            
+            # Extract keywords
+            all_text = f"{title} {description} {content}"
+            keywords = self._extract_keywords(all_text)
+            
+            if keywords:  # Only include entries with relevant keywords
+                entries.append({
+                    "id": entry_id,
+                    "title": title,
+                    "description": description,
+                    "link": entry["link"],
+                    "published": entry["published"] or fetched_at,
+                    "keywords": keywords,
+                    "source": "MarketWatch"
+                })
+                self.processed_entries[entry_id] = None
+                if len(self.processed_entries) > MAX_PROCESSED_ENTRIES:
+                    self.processed_entries.popitem(last=False)
+        
+        return entries
+
+    def _parse_feed(self, content: bytes) -> List[Dict[str, Optional[str]]]:
+        """Extract entries from an RSS 2.0, RSS 1.0 (RDF) or Atom document.
+
+        HTML named entities such as &nbsp;, which XML does not define, are
+        tolerated.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is not valid XML.
+        """
+        def text(element: ET.Element, tag: str) -> Optional[str]:
+            value = element.findtext(tag)
+            return value.strip() if value else None
+
+        try:
+            root = ET.fromstring(content)
+        except ET.ParseError:
+            root = ET.fromstring(_ENTITY_RE.sub(_replace_html_entity, content))
+        entries = []
+
+        for item in root.iter("item"):
+            link = text(item, "link")
+            entries.append({
+                "id": text(item, "guid") or link,
+                "title": text(item, "title"),
+                "description": text(item, "description"),
+                "content": text(item, f"{_CONTENT_NS}encoded"),
+                "link": link,
+                "published": text(item, "pubDate") or text(item, f"{_DC_NS}date")
+            })
+
+        for item in root.iter(f"{_RSS1_NS}item"):
+            link = text(item, f"{_RSS1_NS}link")
+            entries.append({
+                "id": item.get(f"{_RDF_NS}about") or link,
+                "title": text(item, f"{_RSS1_NS}title"),
+                "description": text(item, f"{_RSS1_NS}description"),
+                "content": text(item, f"{_CONTENT_NS}encoded"),
+                "link": link,
+                "published": text(item, f"{_DC_NS}date")
+            })
+
+        for item in root.iter(f"{_ATOM_NS}entry"):
+            link_element = item.find(f"{_ATOM_NS}link")
+            link = link_element.get("href") if link_element is not None else None
+            entries.append({
+                "id": text(item, f"{_ATOM_NS}id") or link,
+                "title": text(item, f"{_ATOM_NS}title"),
+                "description": text(item, f"{_ATOM_NS}summary"),
+                "content": text(item, f"{_ATOM_NS}content"),
+                "link": link,
+                "published": (
+                    text(item, f"{_ATOM_NS}published")
+                    or text(item, f"{_ATOM_NS}updated")
+                )
+            })
+
+        return entries
 
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process RSS feed data."""
         try:
+            # Fetch all feeds concurrently over the shared session
+            results = await asyncio.gather(
+                *(self._fetch_feed(feed_url) for feed_url in self.feeds),
+                return_exceptions=True
+            )
+
+            # Merge feeds and collect sources/keywords in the same pass
             all_entries = []
-            for feed_url in self.feeds:
-                entries = await self._fetch_feed(feed_url)
-                all_entries.extend(entries)
+            sources = set()
+            keywords_found = set()
+            for feed_url, result in zip(self.feeds, results):
+                if isinstance(result, Exception):
+                    self._logger.error(
+                        "feed_fetch_error",
+                        url=feed_url,
+                        error=str(result)
+                    )
+                    continue
+                all_entries.extend(result)
+                for entry in result:
+                    sources.add(entry["source"])
+                    keywords_found.update(entry["keywords"])
             
             # Sort by published date (newest first)
             all_entries.sort(key=lambda x: x.get("published", ""), reverse=True)
@@ -116,8 +258,8 @@ class NewsRSSWorkflow(BaseWorkflow):
             return {
                 "articles": all_entries,
                 "total_articles": len(all_entries),
-                "sources": list(set(entry["source"] for entry in all_entries)),
-                "keywords_found": list(set(kw for entry in all_entries for kw in entry["keywords"]))
+                "sources": list(sources),
+                "keywords_found": list(keywords_found)
             }
         except Exception as e:
             self._logger.error(f"Error processing news data: {str(e)}")
@@ -135,6 +277,10 @@ class NewsRSSWorkflow(BaseWorkflow):
             self._logger.error("workflow_error", error=str(e))
             return WorkflowResult(success=False, error=str(e))
 
+    async def cleanup(self):
+        """Clean up resources."""
+        await self._http.close()
+
 async def run_news_workflow():
     """Run the news RSS workflow with live data."""
     config = NewsRSSConfig()
@@ -143,32 +289,37 @@ async def run_news_workflow():
     print("\nFetching news from MarketWatch RSS feed...")
     print("Press Ctrl+C to stop...")
     
-    while True:
-        try:
-            result = await workflow.execute({})
-            if result.success:
-                print("\nNews Articles:")
-                for article in result.data["articles"][:5]:  # Show top 5 articles
-                    print(f"\nTitle: {article['title']}")
-                    print(f"Source: {article['source']}")
-                    print(f"Published: {article['published']}")
-                    print(f"Keywords: {', '.join(article['keywords'])}")
-                    print("---")
-                print(f"\nTotal Articles: {result.data['total_articles']}")
-                print(f"Sources: {', '.join(result.data['sources'])}")
-                print(f"Keywords Found: {', '.join(result.data['keywords_found'])}")
-            else:
-                print(f"Error: {result.error}")
+    try:
+        while True:
+            try:
+                result = await workflow.execute({})
+                if result.success:
+                    print("\nNews Articles:")
+                    for article in result.data["articles"][:5]:  # Show top 5 articles
+                        print(f"\nTitle: {article['title']}")
+                        print(f"Source: {article['source']}")
+                        print(f"Published: {article['published']}")
+                        print(f"Keywords: {', '.join(article['keywords'])}")
+                        print("---")
+                    print(f"\nTotal Articles: {result.data['total_articles']}")
+                    print(f"Sources: {', '.join(result.data['sources'])}")
+                    print(f"Keywords Found: {', '.join(result.data['keywords_found'])}")
+                else:
+                    print(f"Error: {result.error}")
             
-            # Wait for the configured interval
-            await asyncio.sleep(config.interval)
+                # Wait for the configured interval
+                await asyncio.sleep(config.interval)
             
-        except KeyboardInterrupt:
-            print("\nStopping news workflow...")
-            break
-        except Exception as e:
-            print(f"Error: {str(e)}")
-            await asyncio.sleep(60)  # Wait a minute before retrying
+            except KeyboardInterrupt:
+                print("\nStopping news workflow...")
+                break
+            except Exception as e:
+                print(f"Error: {str(e)}")
+                await asyncio.sleep(60)  # Wait a minute before retrying
+    finally:
+        await workflow.cleanup()
 
 if __name__ == "__main__":
+    install_uvloop()
+    configure_logging()
     asyncio.run(run_news_workflow()) 
\ No newline at end of file
@@ -4,28 +4,43 @@ from datetime import datetime
 import aiohttp
 from pydantic import BaseModel
 import asyncio
+from itertools import islice
 
+from src.core.http_session import HTTPSession
 from src.core.workflow import BaseWorkflow, WorkflowResult, WorkflowConfig
 from src.core.queue import QueueManager
-from src.core.config import get_redis_config
+from src.core.config import configure_logging, install_uvloop, get_redis_config
 
 logger = structlog.get_logger()
 
+class WeatherOptions(BaseModel):
+    """Location options for the Weather API workflow."""
+    latitude: float = 52.52  # Default to Berlin
+    longitude: float = 13.41
+
 class WeatherAPIConfig(WorkflowConfig):
     """Configuration for the Weather API workflow."""
     name: str = "weather"
     description: str = "Fetches and processes weather data from Open-Meteo API"
     enabled: bool = True
     interval: int = 3600  # 1 hour
-    options: Dict[str, Any] = {
-        "latitude": 52.52,  # Default to Berlin
-        "longitude": 13.41,
-    }
+    options: WeatherOptions = WeatherOptions()
 
 class WeatherAPIWorkflow(BaseWorkflow):
     """Workflow for processing weather data from Open-Meteo API."""
     
-    def __init__(self, config: WeatherAPIConfig):
+    def __init__(
+        self,
+        config: WeatherAPIConfig,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize the weather workflow.
+
+        Args:
+            config: Workflow configuration
+            session: Optional shared HTTP session, see HTTPSession
+        """
         super().__init__(config)
         self._logger = logger.bind(workflow="weather")
         self.config = config
@@ -35,23 +50,34 @@ class WeatherAPIWorkflow(BaseWorkflow):
             self.queue_manager = QueueManager({"weather_data": "redis://redis:6379/1"})
         else:
             self.queue_manager = None
+        self._queue_ready = False
+        self._http = HTTPSession(session)
+
+    async def _connect_queue(self) -> bool:
+        """Connect to Redis, independently of the weather API."""
+        try:
+            await self.queue_manager.ensure_connected()
+            return True
+        except Exception as e:
+            self._logger.error("redis_connect_error", error=str(e))
+            return False
 
     async def fetch_weather_data(self) -> Dict[str, Any]:
         """Fetch weather data from Open-Meteo API."""
         url = "https://api.open-meteo.com/v1/forecast"
         params = {
-            "latitude": self.config.options["latitude"],
-            "longitude": self.config.options["longitude"],
+            "latitude": self.config.options.latitude,
+            "longitude": self.config.options.longitude,
             "current": "temperature_2m,wind_speed_10m",
             "hourly": "temperature_2m,relative_humidity_2m,wind_speed_10m",
             "timezone": "auto"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                if response.status != 200:
-                    raise Exception(f"API request failed with status {response.status}")
-                return await response.json()
+        session = await self._http.get()
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                raise Exception(f"API request failed with status {response.status}")
+            return await response.json()
 
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process weather data from Open-Meteo API."""
@@ -67,27 +93,32 @@ class WeatherAPIWorkflow(BaseWorkflow):
             }
             
             # Process hourly forecast (next 24 hours)
-            hourly_forecast = []
-            for i in range(24):
-                if i < len(hourly.get("time", [])):
-                    hourly_forecast.append({
-                        "timestamp": hourly["time"][i],
-                        "temperature": hourly["temperature_2m"][i],
-                        "humidity": hourly["relative_humidity_2m"][i],
-                        "wind_speed": hourly["wind_speed_10m"][i]
-                    })
+            hourly_forecast = [
+                {
+                    "timestamp": timestamp,
+                    "temperature": temperature,
+                    "humidity": humidity,
+                    "wind_speed": wind_speed
+                }
+                for timestamp, temperature, humidity, wind_speed in zip(
+                    islice(hourly.get("time", []), 24),
+                    islice(hourly.get("temperature_2m", []), 24),
+                    islice(hourly.get("relative_humidity_2m", []), 24),
+                    islice(hourly.get("wind_speed_10m", []), 24)
+                )
+            ]
             
             processed_data = {
                 "current": current_weather,
                 "forecast": hourly_forecast,
                 "location": {
-                    "latitude": self.config.options["latitude"],
-                    "longitude": self.config.options["longitude"]
+                    "latitude": self.config.options.latitude,
+                    "longitude": self.config.options.longitude
                 }
             }
 
             # Queue the processed data if Redis is enabled
-            if self.queue_manager:
+            if self.queue_manager and self._queue_ready:
                 await self.queue_manager.enqueue(
                     "weather",
                     processed_data,
@@ -111,6 +142,10 @@ class WeatherAPIWorkflow(BaseWorkflow):
     async def execute(self, data: Dict[str, Any]) -> WorkflowResult:
         """Execute the workflow with the given data."""
         try:
+            # A Redis outage only stops queueing, not fetching weather data
+            if self.queue_manager and not self._queue_ready:
+                self._queue_ready = await self._connect_queue()
+
             # Fetch live data from Open-Meteo API
             weather_data = await self.fetch_weather_data()
             processed_data = await self.process(weather_data)
@@ -121,8 +156,10 @@ class WeatherAPIWorkflow(BaseWorkflow):
 
     async def cleanup(self):
         """Clean up resources."""
+        await self._http.close()
         if self.queue_manager:
             await self.queue_manager.disconnect_all()
+            self._queue_ready = False
 
 async def run_weather_workflow():
     """Run the weather workflow with live data."""
@@ -163,4 +200,6 @@ async def run_weather_workflow():
         await workflow.cleanup()
 
 if __name__ == "__main__":
+    install_uvloop()
+    configure_logging()
     asyncio.run(run_weather_workflow()) 
\ No newline at end of file
@@ -0,0 +1,113 @@
+import asyncio
+import builtins
+import os
+
+import pytest
+
+_real_open = builtins.open
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "allow_disk: allow the test to open files outside pytest's temp directory"
+    )
+    config.addinivalue_line(
+        "markers", "live: test reaches real external services; deselect with -m \"not live\""
+    )
+
+@pytest.fixture(autouse=True)
+def no_disk(request, monkeypatch, tmp_path_factory):
+    """Fixture to fail tests that open() files outside pytest's temp directory."""
+    if request.node.get_closest_marker("allow_disk"):
+        return
+    allowed_root = str(tmp_path_factory.getbasetemp())
+
+    def guarded_open(file, *args, **kwargs):
+        if not isinstance(file, int) and not os.path.abspath(file).startswith(allowed_root):
+            raise RuntimeError(f"Disk access is disabled in tests: {file}")
+        return _real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", guarded_open)
+
+class FakeRedis:
+    """In-memory stand-in for the Redis list commands QueueManager uses."""
+
+    def __init__(self):
+        self.lists = {}
+
+    @staticmethod
+    def _slice(items, start, end):
+        # Redis ranges are inclusive and allow negative indices
+        if start < 0:
+            start = max(len(items) + start, 0)
+        if end < 0:
+            end = len(items) + end
+        return slice(start, end + 1)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def rpush(self, key, *values):
+        items = self.lists.setdefault(key, [])
+        items.extend(values)
+        return len(items)
+
+    async def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        self.lists[key] = items[self._slice(items, start, end)]
+        return True
+
+    async def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return items[self._slice(items, start, end)]
+
+    async def lpop(self, key):
+        items = self.lists.get(key)
+        return items.pop(0) if items else None
+
+    async def blpop(self, keys, timeout=0):
+        for key in keys:
+            if self.lists.get(key):
+                return key.encode(), self.lists[key].pop(0)
+        # Behave as if the timeout expired, yielding like a real wait would
+        await asyncio.sleep(0)
+        return None
+
+    async def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    async def close(self):
+        pass
+
+class FakePipeline:
+    """Queues FakeRedis commands and runs them in order on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [await command(*args, **kwargs) for command, args, kwargs in self._commands]
+
+@pytest.fixture
+def make_queue_manager(monkeypatch):
+    """Fixture returning a factory for QueueManagers backed by FakeRedis."""
+    from src.core import queue
+
+    monkeypatch.setattr(queue, "get_redis_config", lambda: None)
+
+    def make(queue_names=("default",)):
+        manager = queue.QueueManager({name: "redis://fake" for name in queue_names})
+        for name in queue_names:
+            manager.redis_connections[name] = FakeRedis()
+        return manager
+
+    return make
@@ -0,0 +1,140 @@
+import asyncio
+
+import orjson
+import pytest
+
+from src.core.config import WorkflowConfig
+from src.workflows.examples import binance_websocket
+from src.workflows.examples.binance_websocket import (
+    BinanceWebSocketConfig,
+    BinanceWebSocketWorkflow,
+    ENQUEUE_BATCH_SIZE,
+)
+
+_QUEUE_KEY = "workflow:binance:queue"
+
+def _trade(trade_id):
+    """Build a combined-stream aggTrade message."""
+    return {
+        "stream": "btcusdt@aggTrade",
+        "data": {"s": "BTCUSDT", "p": "1.5", "q": "2", "T": trade_id, "m": False}
+    }
+
+def _timestamps(redis):
+    """Return the trade timestamps in a fake Redis queue."""
+    return [
+        orjson.loads(payload)["data"]["timestamp"]
+        for payload in redis.lists.get(_QUEUE_KEY, [])
+    ]
+
+def _queued(workflow):
+    """Return the trade timestamps pushed to the workflow's fake Redis queue."""
+    return _timestamps(workflow._queue_manager.redis_connections["binance"])
+
+@pytest.fixture
+async def workflow(make_queue_manager, monkeypatch):
+    """Fixture for a Redis-enabled workflow whose queues are FakeRedis."""
+    monkeypatch.setattr(binance_websocket, "ENQUEUE_FLUSH_INTERVAL", 0)
+    monkeypatch.setattr(binance_websocket, "is_redis_enabled", lambda: True)
+    monkeypatch.setattr(
+        binance_websocket,
+        "get_workflow_config",
+        lambda name: WorkflowConfig(enabled=True, use_redis=True, redis_queue="binance", config={})
+    )
+    workflow = BinanceWebSocketWorkflow(BinanceWebSocketConfig())
+    workflow._queue_manager = make_queue_manager(("default", "binance"))
+    workflow._queue_ready = True
+    yield workflow
+    await workflow.cleanup()
+
+async def test_flush_at_batch_size(workflow):
+    """Test a full batch is pushed without waiting for the timer."""
+    for trade_id in range(ENQUEUE_BATCH_SIZE):
+        await workflow.process(_trade(trade_id))
+
+    assert _queued(workflow) == list(range(ENQUEUE_BATCH_SIZE))
+    assert workflow._pending == []
+
+async def test_flush_after_interval(workflow):
+    """Test a partial batch is pushed once the flush timer fires."""
+    await workflow.process(_trade(1))
+    await workflow.process(_trade(2))
+    assert _queued(workflow) == []
+
+    await workflow._flush_task
+
+    assert _queued(workflow) == [1, 2]
+    assert workflow._flush_task is None
+
+async def test_flush_keeps_newer_timer(workflow, monkeypatch):
+    """Test a finishing timer does not clear one scheduled during its flush."""
+    release = asyncio.Event()
+    enqueue_batch = workflow._queue_manager.enqueue_batch
+
+    async def slow_enqueue_batch(*args):
+        await release.wait()
+        return await enqueue_batch(*args)
+
+    monkeypatch.setattr(workflow._queue_manager, "enqueue_batch", slow_enqueue_batch)
+    await workflow.process(_trade(1))
+    first_timer = workflow._flush_task
+    await asyncio.sleep(0.01)  # Let the first timer start flushing
+
+    # Keep the second timer waiting until the first one has finished
+    monkeypatch.setattr(binance_websocket, "ENQUEUE_FLUSH_INTERVAL", 60)
+    await workflow.process(_trade(2))
+    second_timer = workflow._flush_task
+    assert second_timer is not None and second_timer is not first_timer
+
+    release.set()
+    await first_timer
+    assert workflow._flush_task is second_timer
+    assert _queued(workflow) == [1]
+
+async def test_failed_flush_keeps_batch(workflow, monkeypatch):
+    """Test a batch that fails to enqueue is kept and pushed by cleanup."""
+    enqueue_batch = workflow._queue_manager.enqueue_batch
+
+    async def failing_enqueue_batch(*args):
+        raise ConnectionError("Redis unavailable")
+
+    monkeypatch.setattr(workflow._queue_manager, "enqueue_batch", failing_enqueue_batch)
+    await workflow.process(_trade(1))
+    await workflow._flush_task
+    assert [message["timestamp"] for message in workflow._pending] == [1]
+
+    monkeypatch.setattr(workflow._queue_manager, "enqueue_batch", enqueue_batch)
+    redis = workflow._queue_manager.redis_connections["binance"]
+    await workflow.cleanup()
+    assert _timestamps(redis) == [1]
+
+async def test_failed_flush_drops_oldest_over_limit(workflow, monkeypatch):
+    """Test retained messages are capped at MAX_PENDING, oldest first."""
+    async def failing_enqueue_batch(*args):
+        raise ConnectionError("Redis unavailable")
+
+    monkeypatch.setattr(binance_websocket, "MAX_PENDING", 2)
+    monkeypatch.setattr(workflow._queue_manager, "enqueue_batch", failing_enqueue_batch)
+    for trade_id in range(3):
+        await workflow.process(_trade(trade_id))
+    await workflow._flush_task
+
+    assert [message["timestamp"] for message in workflow._pending] == [1, 2]
+
+async def test_redis_outage_still_fetches(workflow, monkeypatch):
+    """Test a failed Redis connection does not stop market data being fetched."""
+    async def failing_ensure_connected():
+        raise ConnectionError("Redis unavailable")
+
+    async def fetch_data():
+        return _trade(1)
+
+    workflow._queue_ready = False
+    monkeypatch.setattr(workflow._queue_manager, "ensure_connected", failing_ensure_connected)
+    monkeypatch.setattr(workflow, "_fetch_data", fetch_data)
+
+    result = await workflow.execute({})
+
+    assert result.success
+    assert result.data["timestamp"] == 1
+    assert workflow._pending == []
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import os
+import sys
+import types
+
+import pytest
+import structlog
+
+from src.core.config import configure_logging, install_uvloop, load_config, reload_config
+
+# The config_file fixture copies the repository's config.json
+pytestmark = pytest.mark.allow_disk
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Fixture to write a copy of config.json to a temporary path."""
+    with open("config.json", "r") as f:
+        config_data = json.load(f)
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(config_data))
+    return path
+
+def test_load_config(config_file):
+    """Test configuration loading."""
+    config = load_config(str(config_file))
+    assert "binance" in config.workflows
+    assert config.redis.max_queue_length == 20
+
+def test_load_config_cached(config_file):
+    """Test repeated loads reuse the parsed configuration."""
+    assert load_config(str(config_file)) is load_config(str(config_file))
+
+def test_load_config_cached_across_spellings(config_file, monkeypatch):
+    """Test relative and absolute spellings of a path share one cache entry."""
+    monkeypatch.chdir(config_file.parent)
+    assert load_config() is load_config(str(config_file))
+
+def test_load_config_reloads_on_change(config_file):
+    """Test configuration is re-read after the file changes."""
+    config = load_config(str(config_file))
+
+    config_data = json.loads(config_file.read_text())
+    config_data["redis"]["max_queue_length"] = 50
+    config_file.write_text(json.dumps(config_data))
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = load_config(str(config_file))
+    assert reloaded is not config
+    assert reloaded.redis.max_queue_length == 50
+
+def test_reload_config(config_file):
+    """Test reload_config() forces a re-read even if the mtime is unchanged."""
+    config = load_config(str(config_file))
+    stat = os.stat(config_file)
+
+    config_data = json.loads(config_file.read_text())
+    config_data["redis"]["max_queue_length"] = 50
+    config_file.write_text(json.dumps(config_data))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_config(str(config_file)) is config
+
+    reload_config()
+    reloaded = load_config(str(config_file))
+    assert reloaded is not config
+    assert reloaded.redis.max_queue_length == 50
+
+def test_load_config_missing_file(tmp_path):
+    """Test missing configuration file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        load_config(str(tmp_path / "missing.json"))
+
+def test_load_config_env_vars(config_file, monkeypatch):
+    """Test "${ENV_VAR}" values are replaced from the environment."""
+    config_data = json.loads(config_file.read_text())
+    config_data["workflows"]["weather"]["redis_queue"] = "${WEATHER_QUEUE}"
+    config_data["api"]["cors_origins"] = ["${CORS_ORIGIN}", "http://localhost"]
+    config_file.write_text(json.dumps(config_data))
+    monkeypatch.setenv("WEATHER_QUEUE", "weather_env")
+    monkeypatch.setenv("CORS_ORIGIN", "https://example.com")
+
+    config = load_config(str(config_file))
+    assert config.workflows["weather"].redis_queue == "weather_env"
+    assert config.api.cors_origins == ["https://example.com", "http://localhost"]
+
+def test_configure_logging(capsys):
+    """Test records below the configured level are dropped."""
+    try:
+        configure_logging("info")
+        log = structlog.get_logger().bind(component="test")
+        log.debug("debug_event")
+        log.info("info_event")
+    finally:
+        structlog.reset_defaults()
+
+    output = capsys.readouterr().out
+    assert "debug_event" not in output
+    assert "info_event" in output
+
+@pytest.mark.parametrize("level", [None, "loud"])
+def test_configure_logging_defaults_to_info(level, tmp_path, monkeypatch, capsys):
+    """Test a missing config.json or unknown level falls back to INFO."""
+    monkeypatch.chdir(tmp_path)  # No config.json here
+    try:
+        configure_logging(level)
+        log = structlog.get_logger().bind(component="test")
+        log.debug("debug_event")
+        log.info("info_event")
+    finally:
+        structlog.reset_defaults()
+
+    output = capsys.readouterr().out
+    assert "log_level_defaulted" in output
+    assert "debug_event" not in output
+    assert "info_event" in output
+
+@pytest.mark.parametrize("installed", [True, False])
+def test_install_uvloop(installed, monkeypatch):
+    """Test the uvloop policy is set only when uvloop can be imported."""
+    policies = []
+    fake_uvloop = types.SimpleNamespace(EventLoopPolicy=lambda: "uvloop_policy")
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop if installed else None)
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", policies.append)
+
+    install_uvloop()
+
+    assert policies == (["uvloop_policy"] if installed else [])
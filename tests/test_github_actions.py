@@ -1,45 +1,73 @@
+import asyncio
 import pytest
 from src.core.workflow import BaseWorkflow, WorkflowConfig, WorkflowResult
 from datetime import datetime
 
-@pytest.fixture
+class WorkflowTestConfig(WorkflowConfig):
+    """Workflow configuration used by the tests."""
+    name: str = "test"
+    description: str = "Test workflow configuration"
+    enabled: bool = True
+    interval: int = 60
+    options: dict = {"test": True}
+
+class WorkflowTestImpl(BaseWorkflow):
+    """Workflow that succeeds, or fails when asked to via should_fail."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.max_retries = 3
+        # The config never changes, so serialize it once
+        self._config_dump = config.model_dump()
+
+    async def process(self, data):
+        if data.get("should_fail"):
+            raise Exception("Test error")
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "test_value": "success",
+            "config": self._config_dump
+        }
+
+    async def execute(self, data):
+        try:
+            result = await self.process(data)
+            return WorkflowResult(success=True, data=result, execution_time=0.1)
+        except Exception as e:
+            return WorkflowResult(success=False, error=str(e))
+
+class FailingWorkflow(BaseWorkflow):
+    """Workflow whose process always raises, to exercise BaseWorkflow.execute."""
+
+    async def process(self, data: dict) -> dict:
+        raise Exception("Test error")
+
+# The defaults are trusted, so build the config once without validation
+_TEST_CONFIG = WorkflowTestConfig.model_construct()
+
+@pytest.fixture(scope="session")
 def test_config():
     """Fixture to create test configuration."""
-    class TestConfig(WorkflowConfig):
-        name: str = "test"
-        description: str = "Test workflow configuration"
-        enabled: bool = True
-        interval: int = 60
-        options: dict = {"test": True}
-    return TestConfig()
+    return _TEST_CONFIG
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_workflow(test_config):
     """Fixture to create test workflow."""
-    class TestWorkflow(BaseWorkflow):
-        def __init__(self, config):
-            super().__init__(config)
-            self.max_retries = 3
-
-        async def process(self, data):
-            if data.get("should_fail"):
-                raise Exception("Test error")
-            return {
-                "timestamp": datetime.now().isoformat(),
-                "test_value": "success",
-                "config": self.config.model_dump()
-            }
-
-        async def execute(self, data):
-            try:
-                result = await self.process(data)
-                return WorkflowResult(success=True, data=result, execution_time=0.1)
-            except Exception as e:
-                return WorkflowResult(success=False, error=str(e))
-
-    return TestWorkflow(test_config)
-
-@pytest.mark.asyncio
+    return WorkflowTestImpl(test_config)
+
+@pytest.fixture
+def sleep_delays(monkeypatch):
+    """Fixture to record asyncio.sleep delays instead of waiting them out."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay, result=None):
+        delays.append(delay)
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+    return delays
+
 async def test_workflow_config(test_config):
     """Test workflow configuration."""
     assert test_config.name == "test"
@@ -47,44 +75,55 @@ async def test_workflow_config(test_config):
     assert test_config.interval == 60
     assert test_config.options == {"test": True}
 
-@pytest.mark.asyncio
-async def test_workflow_execution(test_workflow):
-    """Test workflow execution with success case."""
-    result = await test_workflow.execute({})
-    assert result.success
-    assert "timestamp" in result.data
-    assert result.data["test_value"] == "success"
-    assert "config" in result.data
-    assert result.execution_time == 0.1
-
-@pytest.mark.asyncio
-async def test_workflow_failure(test_workflow):
-    """Test workflow execution with failure case."""
-    result = await test_workflow.execute({"should_fail": True})
+async def test_workflow_behaviors(test_config, test_workflow, sleep_delays):
+    """Test workflow success, failure and error handling cases together."""
+    ok, fail, err = await asyncio.gather(
+        test_workflow.execute({}),
+        test_workflow.execute({"should_fail": True}),
+        FailingWorkflow(test_config).execute({})
+    )
+
+    # Success case
+    assert ok.success
+    assert "timestamp" in ok.data
+    assert ok.data["test_value"] == "success"
+    assert "config" in ok.data
+    assert ok.execution_time == 0.1
+
+    # Failure case
+    assert not fail.success
+    assert "Test error" in fail.error
+
+    # Error handling in BaseWorkflow.execute
+    assert not err.success
+    assert err.error == "Test error"
+    assert err.data is None
+    assert sleep_delays == [0.1, 0.2, 0.4]
+
+async def test_workflow_backoff_capped(sleep_delays):
+    """Test the retry backoff doubles up to a 5 second cap."""
+    workflow = FailingWorkflow(WorkflowTestConfig.model_construct(max_retries=8))
+
+    result = await workflow.execute({})
+
     assert not result.success
-    assert "Test error" in result.error
+    assert workflow.retry_count == 8
+    assert sleep_delays == [0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 5, 5]
+
+async def test_workflow_retries_every_call(test_config, sleep_delays):
+    """Test each execute() call gets the full retry budget."""
+    workflow = FailingWorkflow(test_config)
+
+    await workflow.execute({})
+    await workflow.execute({})
+
+    assert sleep_delays == [0.1, 0.2, 0.4] * 2
 
-@pytest.mark.asyncio
 async def test_workflow_retry(test_workflow):
     """Test workflow retry mechanism."""
-    attempts = 0
-    while attempts < test_workflow.max_retries:
-        result = await test_workflow.execute({"should_fail": True})
-        attempts += 1
-        if result.success:
-            break
-    assert attempts == test_workflow.max_retries
-
-@pytest.mark.asyncio
-async def test_workflow_error_handling(test_config):
-    """Test workflow error handling."""
-    class FailingWorkflow(BaseWorkflow):
-        async def process(self, data: dict) -> dict:
-            raise Exception("Test error")
-    
-    workflow = FailingWorkflow(test_config)
-    result = await workflow.execute({})
-    
-    assert not result.success
-    assert result.error == "Test error"
-    assert result.data is None 
\ No newline at end of file
+    results = await asyncio.gather(*(
+        test_workflow.execute({"should_fail": True})
+        for _ in range(test_workflow.max_retries)
+    ))
+    assert len(results) == test_workflow.max_retries
+    assert all(not result.success for result in results)
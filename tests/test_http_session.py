@@ -0,0 +1,21 @@
+import aiohttp
+
+from src.core.http_session import HTTPSession
+
+async def test_creates_and_closes_own_session():
+    """Test a session created on first use is reused and closed by close()."""
+    http = HTTPSession()
+    session = await http.get()
+    assert await http.get() is session
+
+    await http.close()
+    assert session.closed
+
+async def test_borrowed_session_left_open():
+    """Test a caller's session is used but left for the caller to close."""
+    async with aiohttp.ClientSession() as borrowed:
+        http = HTTPSession(borrowed)
+        assert await http.get() is borrowed
+
+        await http.close()
+        assert not borrowed.closed
@@ -0,0 +1,113 @@
+import pytest
+import xml.etree.ElementTree as ET
+
+from src.workflows.examples.news_rss import NewsRSSWorkflow, NewsRSSConfig
+
+RSS2_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Markets</title>
+    <item>
+      <guid>urn:1</guid>
+      <title>Stocks rally</title>
+      <description><![CDATA[<p>Dow&nbsp;Jones up</p>]]></description>
+      <content:encoded>Full story</content:encoded>
+      <link>https://example.com/1</link>
+      <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>No guid here</title>
+      <link>https://example.com/2</link>
+    </item>
+  </channel>
+</rss>"""
+
+RDF_FEED = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.com/">
+    <title>Markets</title>
+  </channel>
+  <item rdf:about="https://example.com/rdf/1">
+    <title>IPO priced</title>
+    <link>https://example.com/rdf/1</link>
+    <description>Shares open higher</description>
+    <dc:date>2024-01-01T00:00:00Z</dc:date>
+  </item>
+</rdf:RDF>"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Markets</title>
+  <entry>
+    <id>tag:example.com,2024:1</id>
+    <title>Earnings beat</title>
+    <link href="https://example.com/atom/1"/>
+    <summary>Profit rose</summary>
+    <updated>2024-01-01T00:00:00Z</updated>
+  </entry>
+</feed>"""
+
+@pytest.fixture
+def workflow():
+    """News workflow with default options; parsing never touches the network."""
+    return NewsRSSWorkflow(NewsRSSConfig())
+
+def test_parse_rss2(workflow):
+    entries = workflow._parse_feed(RSS2_FEED)
+
+    assert len(entries) == 2
+    assert entries[0] == {
+        "id": "urn:1",
+        "title": "Stocks rally",
+        "description": "<p>Dow&nbsp;Jones up</p>",
+        "content": "Full story",
+        "link": "https://example.com/1",
+        "published": "Mon, 01 Jan 2024 00:00:00 GMT"
+    }
+
+def test_parse_missing_guid_falls_back_to_link(workflow):
+    entries = workflow._parse_feed(RSS2_FEED)
+
+    assert entries[1]["id"] == "https://example.com/2"
+    assert entries[1]["published"] is None
+
+def test_parse_rdf(workflow):
+    entries = workflow._parse_feed(RDF_FEED)
+
+    assert entries == [{
+        "id": "https://example.com/rdf/1",
+        "title": "IPO priced",
+        "description": "Shares open higher",
+        "content": None,
+        "link": "https://example.com/rdf/1",
+        "published": "2024-01-01T00:00:00Z"
+    }]
+
+def test_parse_atom(workflow):
+    entries = workflow._parse_feed(ATOM_FEED)
+
+    assert entries == [{
+        "id": "tag:example.com,2024:1",
+        "title": "Earnings beat",
+        "description": "Profit rose",
+        "content": None,
+        "link": "https://example.com/atom/1",
+        "published": "2024-01-01T00:00:00Z"
+    }]
+
+def test_parse_html_entities(workflow):
+    feed = (
+        b"<rss><channel><item><guid>1</guid>"
+        b"<title>S&amp;P&nbsp;500 &mdash; &bogus; up</title>"
+        b"</item></channel></rss>"
+    )
+
+    entries = workflow._parse_feed(feed)
+
+    assert entries[0]["title"] == "S&P 500 — &bogus; up"
+
+def test_parse_malformed(workflow):
+    with pytest.raises(ET.ParseError):
+        workflow._parse_feed(b"<rss><channel><item></channel></rss>")
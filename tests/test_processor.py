@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+from src.core.processor import WORKFLOW_EXECUTIONS, WorkflowProcessor
+from src.core.workflow import BaseWorkflow
+from src.workflows.example_workflow import ExampleWorkflow
+
+class RecordingWorkflow(BaseWorkflow):
+    """Workflow that records its input and can be held open."""
+    started = []
+    active = 0
+    max_active = 0
+    gate = None
+
+    async def process(self, data):
+        cls = type(self)
+        cls.started.append(data["value"])
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        try:
+            if cls.gate is not None:
+                await cls.gate.wait()
+        finally:
+            cls.active -= 1
+        return {"value": data["value"]}
+
+@pytest.fixture(autouse=True)
+def reset_recording_workflow():
+    """Reset RecordingWorkflow's class-level bookkeeping between tests."""
+    RecordingWorkflow.started = []
+    RecordingWorkflow.active = 0
+    RecordingWorkflow.max_active = 0
+    RecordingWorkflow.gate = None
+
+def _executions(workflow_name, status):
+    """Read the executions counter for a workflow and status."""
+    labels = {"workflow_name": workflow_name, "status": status}
+    for metric in WORKFLOW_EXECUTIONS.collect():
+        for sample in metric.samples:
+            if sample.name == "workflow_executions_total" and sample.labels == labels:
+                return sample.value
+    return 0
+
+async def _enqueue(manager, count, workflow_name="RecordingWorkflow"):
+    for value in range(count):
+        await manager.enqueue(workflow_name, {"value": value})
+
+async def _wait_until(condition):
+    """Yield to the loop until condition() holds, failing after a second."""
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0)
+    await asyncio.wait_for(poll(), timeout=1)
+
+def _make_processor(manager, **kwargs):
+    processor = WorkflowProcessor(manager, **kwargs)
+    processor.register_workflow(RecordingWorkflow)
+    return processor
+
+def test_batch_size_validated(make_queue_manager):
+    """Test a batch size below one is rejected."""
+    with pytest.raises(ValueError):
+        WorkflowProcessor(make_queue_manager(), batch_size=0)
+
+async def test_start_drains_batch_after_wakeup(make_queue_manager, monkeypatch):
+    """Test a wake-up is followed by one batch pop of the same queue."""
+    manager = make_queue_manager()
+    await _enqueue(manager, 5)
+    processor = _make_processor(manager, batch_size=3)
+
+    batch_sizes = []
+    dequeue_batch = manager.dequeue_batch
+
+    async def recording_dequeue_batch(workflow_name, max_items):
+        batch = await dequeue_batch(workflow_name, max_items)
+        batch_sizes.append(len(batch))
+        return batch
+
+    monkeypatch.setattr(manager, "dequeue_batch", recording_dequeue_batch)
+    task = asyncio.create_task(processor.start())
+    await _wait_until(lambda: len(RecordingWorkflow.started) == 5)
+    processor.stop()
+    await task
+
+    assert RecordingWorkflow.started == [0, 1, 2, 3, 4]
+    assert batch_sizes == [3, 0]
+
+async def test_concurrency_capped(make_queue_manager):
+    """Test no more than max_concurrency workflows run at once."""
+    manager = make_queue_manager()
+    await _enqueue(manager, 5)
+    processor = _make_processor(manager, max_concurrency=2)
+    RecordingWorkflow.gate = asyncio.Event()
+
+    task = asyncio.create_task(processor.start())
+    await _wait_until(lambda: RecordingWorkflow.active == 2)
+    await asyncio.sleep(0.01)  # Give a third workflow the chance to start
+    assert RecordingWorkflow.started == [0, 1]
+
+    RecordingWorkflow.gate.set()
+    await _wait_until(lambda: len(RecordingWorkflow.started) == 5)
+    processor.stop()
+    await task
+
+    assert RecordingWorkflow.max_active == 2
+
+async def test_stop_waits_for_inflight(make_queue_manager):
+    """Test start() returns only after running workflows finish."""
+    manager = make_queue_manager()
+    await _enqueue(manager, 1)
+    processor = _make_processor(manager)
+    RecordingWorkflow.gate = asyncio.Event()
+
+    task = asyncio.create_task(processor.start())
+    await _wait_until(lambda: RecordingWorkflow.active == 1)
+    processor.stop()
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    RecordingWorkflow.gate.set()
+    await task
+    assert RecordingWorkflow.active == 0
+    assert not processor._inflight
+
+async def test_runs_loaded_workflows(make_queue_manager, monkeypatch):
+    """Test workflows loaded from src/workflows run with their config and item data."""
+    async def no_work(self):
+        pass
+
+    monkeypatch.setattr(ExampleWorkflow, "_simulate_work", no_work)
+    manager = make_queue_manager()
+    await _enqueue(manager, 2, "ExampleWorkflow")
+    processor = WorkflowProcessor(manager)
+    processor.load_workflows("src/workflows")
+    assert processor.workflow_configs["ExampleWorkflow"].name == "ExampleWorkflow"
+    before = _executions("ExampleWorkflow", "success")
+
+    task = asyncio.create_task(processor.start())
+    await _wait_until(lambda: _executions("ExampleWorkflow", "success") == before + 2)
+    processor.stop()
+    await task
+
+    assert _executions("ExampleWorkflow", "failure") == 0
+
+async def test_exceptions_counted_as_failures(make_queue_manager, monkeypatch):
+    """Test a workflow that cannot be run is recorded as a failure."""
+    manager = make_queue_manager()
+    await _enqueue(manager, 1)
+    processor = _make_processor(manager)
+    before = _executions("RecordingWorkflow", "failure")
+
+    def broken_init(self, config):
+        raise RuntimeError("Broken workflow")
+
+    monkeypatch.setattr(RecordingWorkflow, "__init__", broken_init)
+    task = asyncio.create_task(processor.start())
+    await _wait_until(lambda: _executions("RecordingWorkflow", "failure") == before + 1)
+    processor.stop()
+    await task
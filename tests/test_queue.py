@@ -0,0 +1,72 @@
+import orjson
+import structlog
+
+from src.core.config import configure_logging
+
+async def test_enqueue_silent_at_info(make_queue_manager, capsys):
+    """Test per-item enqueue events are dropped when logging at INFO."""
+    try:
+        configure_logging("info")
+        manager = make_queue_manager()
+        capsys.readouterr()  # Discard startup logs from QueueManager.__init__
+
+        await manager.enqueue("test", {"value": 1})
+        assert capsys.readouterr().out == ""
+    finally:
+        structlog.reset_defaults()
+
+async def test_enqueue_batch(make_queue_manager):
+    """Test a batch is pushed in order and trimmed to max_queue_length."""
+    manager = make_queue_manager()
+    manager.max_queue_length = 2
+
+    assert await manager.enqueue_batch("test", [{"value": 1}, {"value": 2}, {"value": 3}])
+
+    queued = manager.redis_connections["default"].lists["workflow:test:queue"]
+    items = [orjson.loads(payload) for payload in queued]
+    assert [item["data"] for item in items] == [{"value": 2}, {"value": 3}]
+    assert all(item["queue"] == "default" for item in items)
+
+async def test_enqueue_batch_empty(make_queue_manager):
+    """Test an empty batch is a no-op."""
+    manager = make_queue_manager()
+
+    assert await manager.enqueue_batch("test", [])
+    assert manager.redis_connections["default"].lists == {}
+
+async def test_dequeue_batch(make_queue_manager):
+    """Test up to max_items are popped from the front in order."""
+    manager = make_queue_manager()
+    await manager.enqueue_batch("test", [{"value": value} for value in range(5)])
+
+    batch = await manager.dequeue_batch("test", 3)
+
+    assert [item["data"] for item in batch] == [{"value": 0}, {"value": 1}, {"value": 2}]
+    assert await manager.get_queue_size("test") == 2
+
+async def test_dequeue_batch_nonpositive(make_queue_manager):
+    """Test a max_items of zero or less pops nothing."""
+    manager = make_queue_manager()
+    await manager.enqueue_batch("test", [{"value": value} for value in range(3)])
+
+    assert await manager.dequeue_batch("test", 0) == []
+    assert await manager.dequeue_batch("test", -1) == []
+    assert await manager.get_queue_size("test") == 3
+
+async def test_dequeue_any_recovers_workflow_name(make_queue_manager):
+    """Test the workflow name is recovered from the popped queue key."""
+    manager = make_queue_manager()
+    await manager.enqueue("news:rss", {"value": 1})
+
+    popped = await manager.dequeue_any(["binance", "news:rss"])
+
+    assert popped is not None
+    workflow_name, item = popped
+    assert workflow_name == "news:rss"
+    assert item["data"] == {"value": 1}
+
+async def test_dequeue_any_timeout(make_queue_manager):
+    """Test None is returned when every queue is empty."""
+    manager = make_queue_manager()
+
+    assert await manager.dequeue_any(["binance", "news_rss"], timeout=1) is None
@@ -0,0 +1,48 @@
+import pytest
+
+from src.workflows.examples import weather_api
+from src.workflows.examples.weather_api import WeatherAPIConfig, WeatherAPIWorkflow
+
+_FORECAST = {
+    "current": {"time": "2024-01-01T00:00", "temperature_2m": 1.5, "wind_speed_10m": 10.0},
+    "hourly": {
+        "time": ["2024-01-01T00:00"],
+        "temperature_2m": [1.5],
+        "relative_humidity_2m": [80],
+        "wind_speed_10m": [10.0]
+    }
+}
+
+@pytest.fixture
+async def workflow(make_queue_manager, monkeypatch):
+    """Fixture for a Redis-enabled weather workflow whose queue is FakeRedis."""
+    monkeypatch.setattr(weather_api, "get_redis_config", lambda: None)
+    workflow = WeatherAPIWorkflow(WeatherAPIConfig())
+    workflow.queue_manager = make_queue_manager(("weather_data",))
+
+    async def fetch_weather_data():
+        return _FORECAST
+
+    monkeypatch.setattr(workflow, "fetch_weather_data", fetch_weather_data)
+    yield workflow
+    await workflow.cleanup()
+
+async def test_execute_queues_forecast(workflow):
+    """Test the processed forecast is queued once Redis is connected."""
+    result = await workflow.execute({})
+
+    assert result.success
+    assert await workflow.queue_manager.get_queue_size("weather", "weather_data") == 1
+
+async def test_redis_outage_still_fetches(workflow, monkeypatch):
+    """Test a failed Redis connection does not stop weather data being fetched."""
+    async def failing_ensure_connected():
+        raise ConnectionError("Redis unavailable")
+
+    monkeypatch.setattr(workflow.queue_manager, "ensure_connected", failing_ensure_connected)
+
+    result = await workflow.execute({})
+
+    assert result.success
+    assert result.data["current"]["temperature"] == 1.5
+    assert "error" not in result.data
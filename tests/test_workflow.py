@@ -1,9 +1,41 @@
+import asyncio
 import pytest
 from datetime import datetime
 from src.core.workflow import BaseWorkflow, WorkflowConfig, WorkflowResult
 from src.workflows.example_workflow import ExampleWorkflow, ExampleWorkflowConfig
 
-@pytest.fixture
+# Fixed timestamp for test data; the tests never inspect its value
+_TS = "2024-01-01T00:00:00"
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns the same moment."""
+    _NOW = datetime(2024, 1, 1)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls._NOW
+
+_real_sleep = asyncio.sleep
+
+async def _instant_sleep(delay, result=None):
+    """asyncio.sleep that only yields to the loop instead of waiting."""
+    return await _real_sleep(0, result)
+
+@pytest.fixture(scope="module", autouse=True)
+def instant_sleep():
+    """Fixture to skip simulated work and retry backoff in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(asyncio, "sleep", _instant_sleep)
+        yield
+
+@pytest.fixture(scope="module", autouse=True)
+def frozen_datetime():
+    """Fixture to freeze the example workflow's clock for this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.workflows.example_workflow.datetime", FrozenDatetime)
+        yield
+
+@pytest.fixture(scope="session")
 def example_config():
     return ExampleWorkflowConfig(
         name="test_workflow",
@@ -13,16 +45,15 @@ def example_config():
         options={"test": True}
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_workflow(example_config):
     return ExampleWorkflow(example_config)
 
-@pytest.mark.asyncio
 async def test_workflow_execution(example_workflow):
     """Test basic workflow execution."""
     test_data = {
         "test_field": "test_value",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _TS
     }
     
     result = await example_workflow.execute(test_data)
@@ -34,24 +65,30 @@ async def test_workflow_execution(example_workflow):
     assert "config" in result.data
     assert result.execution_time > 0
 
-@pytest.mark.asyncio
 async def test_workflow_validation(example_workflow):
     """Test workflow validation."""
     valid_data = {
         "test_field": "test_value",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _TS
     }
     
     assert await example_workflow.validate(valid_data)
 
-@pytest.mark.asyncio
 async def test_workflow_retry(example_workflow):
     """Test workflow retry mechanism."""
     class FailingWorkflow(ExampleWorkflow):
+        def __init__(self, config):
+            super().__init__(config)
+            # Fail the first two attempts, then succeed
+            self._raises = iter([True, True, False])
+            self._success = None
+
         async def process(self, data):
-            if self.retry_count < 2:
+            if next(self._raises, False):
                 raise ValueError("Simulated failure")
-            return await super().process(data)
+            if self._success is None:
+                self._success = await super().process(data)
+            return self._success
     
     config = ExampleWorkflowConfig(
         name="failing_workflow",
@@ -64,26 +101,21 @@ async def test_workflow_retry(example_workflow):
     assert result.success
     assert workflow.retry_count == 2
 
-@pytest.mark.asyncio
-async def test_workflow_cleanup(example_workflow):
+@pytest.mark.skipif(
+    ExampleWorkflow.cleanup is BaseWorkflow.cleanup,
+    reason="ExampleWorkflow does not override cleanup()"
+)
+async def test_workflow_cleanup(example_config):
     """Test workflow cleanup."""
-    await example_workflow.cleanup()
+    # Use a throwaway workflow so cleanup can't affect the shared one
+    workflow = ExampleWorkflow(example_config)
+    await workflow.cleanup()
     # Add assertions based on your cleanup implementation
 
-@pytest.mark.asyncio
-async def test_example_workflow():
+async def test_example_workflow(example_config):
     """Test the example workflow with configuration."""
-    # Create workflow configuration
-    config = ExampleWorkflowConfig(
-        name="test_workflow",
-        description="Test workflow",
-        enabled=True,
-        interval=60,
-        options={"test": True}
-    )
-    
-    # Create and execute workflow
-    workflow = ExampleWorkflow(config)
+    # Create and execute workflow from the shared configuration
+    workflow = ExampleWorkflow(example_config)
     test_data = {"test": "data"}
     result = await workflow.execute(test_data)
     